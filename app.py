@@ -1,23 +1,50 @@
 """Flask web application for HH.ru Parser."""
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
+import orjson
 from pathlib import Path
 import yaml
 import sys
 import threading
-import json
-from datetime import datetime
-import requests
+import time
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from api_client import HHAPIClient
-from parser import VacancyParser
+from parser import VacancyParser, process_context
 from analyzer import VacancyAnalyzer
-from storage import VacancyStorage
+from storage import VacancyStorage, iter_csv_chunks, iter_json_chunks
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson."""
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string (kwargs are ignored)."""
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compress JSON responses (vacancy pages carry long descriptions); streamed
+# exports are left alone so they are not buffered in memory
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 2048
+app.config["COMPRESS_STREAMS"] = False
+Compress(app)
 
 # Global state
 collection_status = {
@@ -31,6 +58,146 @@ collection_status = {
 current_project_id = 1  # Default project
 
 
+def update_status(**changes):
+    """
+    Publish a new collection status snapshot.
+
+    The status dict is never mutated in place: a new dict is built and the
+    global is rebound, so readers always see a complete snapshot.
+    """
+    global collection_status
+    collection_status = {**collection_status, **changes}
+
+
+# Short-lived cache for filter results and reports: the dashboard re-requests
+# the same data on every pagination click and status poll
+RESULTS_CACHE_TTL = 5  # seconds
+RESULTS_CACHE_SIZE = 32
+results_cache = {}
+results_cache_lock = threading.Lock()
+
+
+def prune_results_cache(now):
+    """Drop expired entries, so they don't keep whole result lists alive."""
+    expired = [
+        key
+        for key, (stored, _) in results_cache.items()
+        if now - stored >= RESULTS_CACHE_TTL
+    ]
+    for key in expired:
+        del results_cache[key]
+
+
+def cached_result(key, compute):
+    """Return the cached value for key, calling compute() if missing or expired."""
+    now = time.monotonic()
+    with results_cache_lock:
+        prune_results_cache(now)
+        entry = results_cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+    value = compute()
+
+    with results_cache_lock:
+        prune_results_cache(time.monotonic())
+        if key not in results_cache and len(results_cache) >= RESULTS_CACHE_SIZE:
+            oldest = min(results_cache, key=lambda k: results_cache[k][0])
+            del results_cache[oldest]
+        results_cache[key] = (now, value)
+    return value
+
+
+def clear_results_cache():
+    """Drop all cached results (call after any data change)."""
+    with results_cache_lock:
+        results_cache.clear()
+
+
+def get_skills_text(vacancy):
+    """Get key skills joined into a single string."""
+    skills = vacancy.get("key_skills", [])
+    return " ".join(skills) if isinstance(skills, list) else str(skills)
+
+
+# Source expressions for the searchable text of each field; long fields use
+# the lowercased copies stored at ingest time
+SEARCH_FIELD_EXPRESSIONS = {
+    "name": "(v.get('name') or '').lower()",
+    "description": "(v.get('description_lc') or (v.get('description') or '').lower())",
+    "skills": "get_skills_text(v).lower()",
+    "full_text": "(v.get('full_text_lc') or (v.get('full_text') or '').lower())",
+}
+
+
+@lru_cache(maxsize=64)
+def compile_filter(hide_empty, has_min, has_max, include_count, exclude_count, fields):
+    """
+    Generate a filter predicate factory specialized for one filter shape.
+
+    Only the clauses that are actually active end up in the generated code,
+    so the per-vacancy predicate has no branching on filter parameters.
+    Filter values are passed to the factory, never embedded in the source.
+
+    Args:
+        hide_empty: Whether vacancies without salary are hidden
+        has_min: Whether a minimum salary is set
+        has_max: Whether a maximum salary is set
+        include_count: Number of include keywords
+        exclude_count: Number of exclude keywords
+        fields: Tuple of fields to search keywords in
+
+    Returns:
+        Function (min_salary, max_salary, include, exclude) -> predicate
+    """
+    include_names = [f"include_{i}" for i in range(include_count)]
+    exclude_names = [f"exclude_{i}" for i in range(exclude_count)]
+
+    lines = ["def make(min_salary, max_salary, include, exclude):"]
+    if include_names:
+        lines.append(f"    ({', '.join(include_names)},) = include")
+    if exclude_names:
+        lines.append(f"    ({', '.join(exclude_names)},) = exclude")
+    lines.append("    def predicate(v):")
+
+    # Salary checks first: they are the cheapest
+    if hide_empty or has_min or has_max:
+        lines.append("        salary_from = v.get('salary_from')")
+        lines.append("        salary_to = v.get('salary_to')")
+    if hide_empty:
+        lines.append("        if salary_from is None and salary_to is None: return False")
+    if has_min:
+        lines.append(
+            "        if not ((salary_from and salary_from >= min_salary)"
+            " or (salary_to and salary_to >= min_salary)): return False"
+        )
+    if has_max:
+        lines.append(
+            "        if not ((salary_from and salary_from <= max_salary)"
+            " or (salary_to and salary_to <= max_salary)"
+            " or (salary_from is None and salary_to is None)): return False"
+        )
+
+    # Keyword checks share one lowercased text per vacancy
+    if include_names or exclude_names:
+        expressions = [SEARCH_FIELD_EXPRESSIONS[f] for f in fields]
+        if len(expressions) == 1:
+            lines.append(f"        text = {expressions[0]}")
+        else:
+            lines.append(f"        text = ' '.join(({', '.join(expressions)}))")
+        for name in include_names:
+            lines.append(f"        if {name} not in text: return False")
+        for name in exclude_names:
+            lines.append(f"        if {name} in text: return False")
+
+    lines.append("        return True")
+    lines.append("    return predicate")
+
+    namespace = {"get_skills_text": get_skills_text}
+    exec(compile("\n".join(lines), "<filter>", "exec"), namespace)
+    return namespace["make"]
+
+
 def apply_filters(
     vacancies,
     min_salary=None,
@@ -56,91 +223,87 @@ def apply_filters(
     Returns:
         Filtered list of vacancies
     """
-    filtered = vacancies
+    # Default search fields
+    if not search_in:
+        search_in = ["full_text"]
+
+    # Lowercase keywords once per request, not once per vacancy
+    include_lower = [kw.lower() for kw in include_keywords or []]
+    exclude_lower = [kw.lower() for kw in exclude_keywords or []]
+
+    # Drop keywords implied by others so each text is scanned fewer times:
+    # a required "python" already implies "py", an excluded "py" already
+    # excludes "python"
+    include_lower = [
+        kw
+        for kw in dict.fromkeys(include_lower)
+        if not any(kw != other and kw in other for other in include_lower)
+    ]
+    exclude_lower = [
+        kw
+        for kw in dict.fromkeys(exclude_lower)
+        if not any(kw != other and other in kw for other in exclude_lower)
+    ]
+    check_keywords = bool(include_lower or exclude_lower)
+
+    has_filters = (
+        hide_empty
+        or min_salary is not None
+        or max_salary is not None
+        or check_keywords
+    )
+    if not has_filters:
+        return vacancies
+
+    make_predicate = compile_filter(
+        bool(hide_empty),
+        min_salary is not None,
+        max_salary is not None,
+        len(include_lower),
+        len(exclude_lower),
+        tuple(f for f in search_in if f in SEARCH_FIELD_EXPRESSIONS),
+    )
+    matches = make_predicate(min_salary, max_salary, include_lower, exclude_lower)
 
-    # Salary filters
-    if hide_empty:
-        filtered = [
-            v
-            for v in filtered
-            if v.get("salary_from") is not None or v.get("salary_to") is not None
-        ]
+    return [v for v in vacancies if matches(v)]
 
-    if min_salary is not None:
-        filtered = [
-            v
-            for v in filtered
-            if (v.get("salary_from") and v["salary_from"] >= min_salary)
-            or (v.get("salary_to") and v["salary_to"] >= min_salary)
-        ]
 
-    if max_salary is not None:
-        filtered = [
-            v
-            for v in filtered
-            if (v.get("salary_from") and v["salary_from"] <= max_salary)
-            or (v.get("salary_to") and v["salary_to"] <= max_salary)
-            or (v.get("salary_from") is None and v.get("salary_to") is None)
-        ]
+# Lowercased search copies and tokens stored with each vacancy; not sent to clients
+SEARCH_TEXT_FIELDS = ("description_lc", "full_text_lc", "tokens")
+
 
-    # Keyword filters
-    if include_keywords or exclude_keywords:
-        # Default search fields
-        if not search_in:
-            search_in = ["full_text"]
-
-        def get_searchable_text(vacancy):
-            """Get combined text from specified fields."""
-            texts = []
-            for field in search_in:
-                if field == "name":
-                    texts.append(vacancy.get("name", ""))
-                elif field == "description":
-                    texts.append(vacancy.get("description", ""))
-                elif field == "skills":
-                    skills = vacancy.get("key_skills", [])
-                    texts.append(
-                        " ".join(skills) if isinstance(skills, list) else str(skills)
-                    )
-                elif field == "full_text":
-                    texts.append(vacancy.get("full_text", ""))
-            return " ".join(texts).lower()
-
-        def matches_include(vacancy, keywords):
-            """Check if vacancy contains ALL include keywords."""
-            if not keywords:
-                return True
-            text = get_searchable_text(vacancy)
-            return all(kw.lower() in text for kw in keywords)
-
-        def matches_exclude(vacancy, keywords):
-            """Check if vacancy contains NONE of exclude keywords."""
-            if not keywords:
-                return True
-            text = get_searchable_text(vacancy)
-            return not any(kw.lower() in text for kw in keywords)
-
-        # Apply keyword filters
-        if include_keywords:
-            filtered = [v for v in filtered if matches_include(v, include_keywords)]
-
-        if exclude_keywords:
-            filtered = [v for v in filtered if matches_exclude(v, exclude_keywords)]
-
-    return filtered
-
-
-# Backward compatibility alias
-def apply_salary_filters(vacancies, min_salary=None, hide_empty=False):
-    """Legacy function - use apply_filters instead."""
-    return apply_filters(vacancies, min_salary=min_salary, hide_empty=hide_empty)
+def public_vacancy(vacancy):
+    """Return a copy of a vacancy without the internal search text fields."""
+    return {k: v for k, v in vacancy.items() if k not in SEARCH_TEXT_FIELDS}
 
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from YAML."""
+    """Load configuration from YAML (parsed once per process)."""
     config_path = Path(__file__).parent / "config" / "config.yaml"
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+
+@lru_cache(maxsize=1)
+def get_storage():
+    """Get the shared storage instance (created once per process)."""
+    config = load_config()
+    return VacancyStorage(config["storage"]["database"])
+
+
+@lru_cache(maxsize=1)
+def get_parse_executor():
+    """
+    Get the worker process used for parsing collected vacancies.
+
+    HTML cleanup and parse cache lookups are CPU-bound; running them in a
+    separate process keeps the GIL free for request handlers while a
+    collection is in progress. Large batches fan out to more processes from
+    inside the worker (see VacancyParser.parse_multiple).
+    """
+    return ProcessPoolExecutor(max_workers=1, mp_context=process_context())
 
 
 @app.route("/")
@@ -154,8 +317,7 @@ def index():
 def get_projects_list():
     """Get all projects."""
     try:
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
         projects = storage.get_projects()
 
         return jsonify(
@@ -177,9 +339,9 @@ def create_new_project():
         name = data.get("name", "New Project")
         query = data.get("query", "")
 
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
         project_id = storage.create_project(name, query)
+        clear_results_cache()
 
         return jsonify({"success": True, "project_id": project_id})
     except Exception as e:
@@ -190,6 +352,12 @@ def create_new_project():
 def switch_project(project_id):
     """Switch current project."""
     global current_project_id
+
+    # Vacancies reference their project by foreign key, so an unknown id
+    # would only fail later, when a collection saves into it
+    if get_storage().get_project(project_id) is None:
+        return jsonify({"success": False, "error": "Project not found"})
+
     current_project_id = project_id
 
     return jsonify({"success": True, "current_project_id": current_project_id})
@@ -203,8 +371,7 @@ def update_project_details(project_id):
         name = data.get("name")
         query = data.get("query")
 
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
         storage.update_project(project_id, name=name, query=query)
 
         return jsonify({"success": True})
@@ -224,9 +391,9 @@ def delete_project_endpoint(project_id):
                 {"success": False, "error": "Cannot delete the default project"}
             )
 
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
         storage.delete_project(project_id)
+        clear_results_cache()
 
         # Switch to default project if current was deleted
         if current_project_id == project_id:
@@ -280,56 +447,102 @@ def has_active_filters(params):
     )
 
 
-@app.route("/api/stats")
-def get_stats():
-    """Get current statistics."""
-    try:
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+def make_params_key(params):
+    """Build a hashable cache key from parsed filter parameters."""
+    return tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in params.items()
+        )
+    )
 
-        # Get filter parameters
-        filter_params = parse_filter_params(request.args)
 
-        vacancies = storage.load_vacancies(current_project_id)
+# Columns needed to filter and analyze vacancies in /api/stats
+STATS_COLUMNS = (
+    "name",
+    "description_lc",
+    "full_text_lc",
+    "tokens",
+    "salary_from",
+    "salary_to",
+    "experience",
+)
 
-        if not vacancies:
-            return jsonify({"success": True, "total_vacancies": 0, "report": None})
 
-        # Apply all filters
-        filtered_vacancies = apply_filters(
-            vacancies,
+def get_filtered_vacancies(project_id, filter_params, columns=None):
+    """
+    Load project vacancies matching all filters (cached for a few seconds).
+
+    Args:
+        project_id: ID of the project
+        filter_params: Parsed filter parameters
+        columns: Vacancy columns to load (None - all)
+    """
+
+    def load():
+        # Salary filters run in SQL, keyword filters in Python
+        vacancies, _ = get_storage().query_vacancies(
+            project_id,
             min_salary=filter_params["min_salary"],
             max_salary=filter_params["max_salary"],
             hide_empty=filter_params["hide_empty"],
+            columns=list(columns) if columns else None,
+        )
+        return apply_filters(
+            vacancies,
             include_keywords=filter_params["include_keywords"],
             exclude_keywords=filter_params["exclude_keywords"],
             search_in=filter_params["search_in"],
         )
 
-        if not filtered_vacancies:
-            return jsonify(
-                {
+    key = ("filtered", project_id, make_params_key(filter_params), columns)
+    return cached_result(key, load)
+
+
+@app.route("/api/stats")
+def get_stats():
+    """Get current statistics."""
+    try:
+        config = load_config()
+        storage = get_storage()
+        project_id = current_project_id
+
+        # Get filter parameters
+        filter_params = parse_filter_params(request.args)
+
+        def build_stats():
+            original_count = storage.count_vacancies(project_id)
+
+            if not original_count:
+                return {"success": True, "total_vacancies": 0, "report": None}
+
+            filtered_vacancies = get_filtered_vacancies(
+                project_id, filter_params, columns=STATS_COLUMNS
+            )
+
+            if not filtered_vacancies:
+                return {
                     "success": True,
                     "total_vacancies": 0,
                     "report": None,
                     "filtered": True,
-                    "original_count": len(vacancies),
+                    "original_count": original_count,
                 }
-            )
 
-        # Analyze filtered vacancies
-        analyzer = VacancyAnalyzer(config)
-        report = analyzer.create_report(filtered_vacancies)
+            # Analyze filtered vacancies
+            analyzer = VacancyAnalyzer(config)
+            report = analyzer.create_report(filtered_vacancies)
 
-        return jsonify(
-            {
+            return {
                 "success": True,
                 "total_vacancies": len(filtered_vacancies),
                 "report": report,
                 "filtered": has_active_filters(filter_params),
-                "original_count": len(vacancies),
+                "original_count": original_count,
             }
-        )
+
+        key = ("stats", project_id, make_params_key(filter_params))
+        return jsonify(cached_result(key, build_stats))
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
@@ -338,45 +551,46 @@ def get_stats():
 def get_vacancies():
     """Get vacancies list with optional filtering."""
     try:
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
+        project_id = current_project_id
 
         # Get filter parameters
         filter_params = parse_filter_params(request.args)
 
-        # Load vacancies for current project
-        vacancies = storage.load_vacancies(current_project_id)
-
-        # Apply all filters
-        filtered_vacancies = apply_filters(
-            vacancies,
-            min_salary=filter_params["min_salary"],
-            max_salary=filter_params["max_salary"],
-            hide_empty=filter_params["hide_empty"],
-            include_keywords=filter_params["include_keywords"],
-            exclude_keywords=filter_params["exclude_keywords"],
-            search_in=filter_params["search_in"],
-        )
-
         # Pagination
         page = int(request.args.get("page", 1))
         per_page = int(request.args.get("per_page", 20))
 
-        start = (page - 1) * per_page
+        start = max((page - 1) * per_page, 0)
         end = start + per_page
 
-        paginated = filtered_vacancies[start:end]
+        original_count = storage.count_vacancies(project_id)
+
+        if filter_params["include_keywords"] or filter_params["exclude_keywords"]:
+            filtered_vacancies = get_filtered_vacancies(project_id, filter_params)
+            total = len(filtered_vacancies)
+            paginated = filtered_vacancies[start:end]
+        else:
+            # Only the requested page leaves the database
+            paginated, total = storage.query_vacancies(
+                project_id,
+                min_salary=filter_params["min_salary"],
+                max_salary=filter_params["max_salary"],
+                hide_empty=filter_params["hide_empty"],
+                limit=per_page,
+                offset=start,
+            )
 
         return jsonify(
             {
                 "success": True,
-                "vacancies": paginated,
-                "total": len(filtered_vacancies),
+                "vacancies": [public_vacancy(v) for v in paginated],
+                "total": total,
                 "page": page,
                 "per_page": per_page,
-                "pages": (len(filtered_vacancies) + per_page - 1) // per_page,
+                "pages": (total + per_page - 1) // per_page,
                 "filtered": has_active_filters(filter_params),
-                "original_count": len(vacancies),
+                "original_count": original_count,
             }
         )
     except Exception as e:
@@ -386,7 +600,7 @@ def get_vacancies():
 @app.route("/api/collect", methods=["POST"])
 def start_collection():
     """Start vacancy collection."""
-    global collection_status, current_project_id
+    global current_project_id
 
     if collection_status["running"]:
         return jsonify({"success": False, "message": "Collection already running"})
@@ -403,27 +617,29 @@ def start_collection():
     project_name = params.get("project_name", query)
     target_project_id = current_project_id
 
+    # Fail before fetching anything rather than when saving the results
+    if not create_new and get_storage().get_project(target_project_id) is None:
+        return jsonify({"success": False, "message": "Project not found"})
+
     def collect():
-        global collection_status, current_project_id
+        global current_project_id
         nonlocal target_project_id
 
-        collection_status["running"] = True
-        collection_status["progress"] = 0
-        collection_status["message"] = "Starting collection..."
+        update_status(running=True, progress=0, message="Starting collection...")
 
         try:
             config = load_config()
             api_client = HHAPIClient(config)
-            storage = VacancyStorage(config["storage"]["database"])
+            storage = get_storage()
 
             # Create new project if requested
             if create_new:
                 target_project_id = storage.create_project(project_name, query)
                 current_project_id = target_project_id  # Switch to new project
-                collection_status["message"] = f"Created new project: {project_name}"
+                update_status(message=f"Created new project: {project_name}")
                 print(f"Created new project ID: {target_project_id}")
 
-            collection_status["message"] = f'Collecting vacancies for "{query}"...'
+            update_status(message=f'Collecting vacancies for "{query}"...')
             raw_vacancies = api_client.collect_all_vacancies(
                 text=query,
                 area=int(area) if area else None,
@@ -436,20 +652,29 @@ def start_collection():
 
             print(f"Collected {len(raw_vacancies)} raw vacancies")
 
-            collection_status["message"] = "Parsing data..."
-            parsed_vacancies = VacancyParser.parse_multiple(raw_vacancies)
+            update_status(message="Parsing data...")
+            parsed_vacancies = (
+                get_parse_executor()
+                .submit(
+                    VacancyParser.parse_multiple,
+                    raw_vacancies,
+                    config["storage"].get("parse_cache"),
+                )
+                .result()
+            )
             print(f"Parsed {len(parsed_vacancies)} vacancies")
 
-            collection_status["message"] = (
-                f"Saving to database (project {target_project_id})..."
+            update_status(
+                message=f"Saving to database (project {target_project_id})..."
             )
             print(f"Saving to project_id={target_project_id}")
             storage.save_vacancies(parsed_vacancies, target_project_id)
+            clear_results_cache()
             print(f"Save completed!")
 
-            collection_status["progress"] = 100
-            collection_status["message"] = (
-                f"Completed! Collected {len(parsed_vacancies)} vacancies"
+            update_status(
+                progress=100,
+                message=f"Completed! Collected {len(parsed_vacancies)} vacancies",
             )
 
         except Exception as e:
@@ -457,9 +682,9 @@ def start_collection():
 
             error_details = traceback.format_exc()
             print(f"ERROR in collection: {error_details}")
-            collection_status["message"] = f"Error: {str(e)}"
+            update_status(message=f"Error: {str(e)}")
         finally:
-            collection_status["running"] = False
+            update_status(running=False)
 
     # Start collection in background
     thread = threading.Thread(target=collect)
@@ -477,22 +702,34 @@ def get_status():
 
 @app.route("/api/export/<format>")
 def export_data(format):
-    """Export data in specified format."""
+    """Export data in specified format (streamed straight from the database)."""
     try:
-        config = load_config()
-        storage = VacancyStorage(config["storage"]["database"])
+        storage = get_storage()
 
-        # Load vacancies for current project
-        vacancies = storage.load_vacancies(current_project_id)
+        # Vacancies for current project are read lazily while streaming
+        vacancies = storage.iter_vacancies(current_project_id)
 
         if format == "json":
-            export_path = storage.export_json(vacancies)
-            return send_file(export_path, as_attachment=True)
+            body = iter_json_chunks(map(public_vacancy, vacancies))
+            mimetype = "application/json"
         elif format == "csv":
-            export_path = storage.export_csv(vacancies)
-            return send_file(export_path, as_attachment=True)
+            body, mimetype = iter_csv_chunks(vacancies), "text/csv"
+        elif format == "parquet":
+            # Columnar and typed, but written as a whole file, so not streamed
+            buffer = io.BytesIO()
+            storage.export_to_parquet(map(public_vacancy, vacancies), buffer)
+            body = buffer.getvalue()
+            mimetype = "application/vnd.apache.parquet"
         else:
             return jsonify({"success": False, "error": "Unsupported format"})
+
+        return Response(
+            body,
+            mimetype=mimetype,
+            headers={
+                "Content-Disposition": f"attachment; filename=vacancies.{format}"
+            },
+        )
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
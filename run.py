@@ -3,6 +3,7 @@
 import webbrowser
 import time
 from threading import Timer
+from waitress import serve
 from app import app
 
 def open_browser():
@@ -24,4 +25,7 @@ if __name__ == '__main__':
     print("=" * 60)
     print()
     
-    app.run(debug=False, host='0.0.0.0', port=5000)
+    # Serve with waitress: a production WSGI server that handles requests on
+    # a thread pool inside this process, so in-memory state (current project,
+    # collection status) stays shared between requests
+    serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -1,9 +1,46 @@
 """Analyzer for extracting keywords and generating insights from vacancy data."""
 
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set
 from collections import Counter
+from itertools import chain
+from operator import itemgetter
+import heapq
 import re
 
+import numpy as np
+
+
+# Words with optional inner hyphens/digits, or single letters
+_TOKEN_RE = re.compile(r'\b[а-яёa-z][\w-]*[а-яёa-z]\b|\b[а-яёa-z]\b')
+
+
+def _compile_token_re(min_length: int) -> re.Pattern:
+    """
+    Build a token pattern that only matches words of at least min_length.
+    
+    Matches exactly the tokens of _TOKEN_RE that are long enough, so short
+    words are skipped inside the regex engine instead of in Python.
+    """
+    if min_length <= 1:
+        return _TOKEN_RE
+    return re.compile(r'\b[а-яёa-z][\w-]{%d,}[а-яёa-z]\b' % (min_length - 2))
+
+
+def join_tokens(text: str) -> str:
+    """
+    Tokenize lowercase text into a space-separated string of all its words.
+    
+    Stored with each vacancy, so reports can split it instead of running
+    the tokenizer again; length and stop word filtering happen at count time.
+    
+    Args:
+        text: Lowercase text
+        
+    Returns:
+        Words separated by single spaces
+    """
+    return ' '.join(_TOKEN_RE.findall(text)) if text else ''
+
 
 class VacancyAnalyzer:
     """Analyzer for vacancy data to extract keywords and competencies."""
@@ -27,32 +64,66 @@ class VacancyAnalyzer:
             'который', 'если', 'быть', 'может', 'также', 'более',
             'чтобы', 'можно', 'либо', 'рамках', 'должен'
         ])
+        self.stop_words = frozenset(self.stop_words)
+        
+        self._token_re = _compile_token_re(self.min_word_length)
     
-    def _tokenize(self, text: str) -> List[str]:
+    def _tokenize(self, text: str, is_lower: bool = False) -> Iterator[str]:
         """
         Tokenize text into words.
         
+        Stop words are kept; extract_keywords removes them from the counts.
+        
         Args:
             text: Text to tokenize
+            is_lower: Whether text is already lowercase
             
         Returns:
-            List of words
+            Iterator over words
         """
         # Convert to lowercase
-        text = text.lower()
+        if not is_lower:
+            text = text.lower()
         
-        # Extract words (including words with hyphens)
-        words = re.findall(r'\b[а-яёa-z][\w-]*[а-яёa-z]\b|\b[а-яёa-z]\b', text)
+        # Extract words of at least min_word_length (including words with
+        # hyphens); tokens always start with a letter, so none are numbers
+        return iter(self._token_re.findall(text))
+    
+    def _tokenize_vacancy(self, vacancy: Dict) -> Iterator[str]:
+        """
+        Tokenize a vacancy's full text.
+        
+        Uses the lowercased copy stored at parse time when it is available,
+        so the text is not lowercased again.
+        
+        Args:
+            vacancy: Parsed vacancy
+            
+        Returns:
+            Iterator over words
+        """
+        text = vacancy.get('full_text_lc')
+        if text is None:
+            return self._tokenize(vacancy.get('full_text', ''))
+        return self._tokenize(text, is_lower=True)
+    
+    def _vacancy_words(self, vacancy: Dict) -> Iterator[str]:
+        """
+        Get all words of a vacancy, stop words included.
         
-        # Filter by length and stop words
-        words = [
-            w for w in words 
-            if len(w) >= self.min_word_length 
-            and w not in self.stop_words
-            and not w.isdigit()
-        ]
+        Splits the tokens stored at parse time when present and only runs
+        the tokenizer for vacancies saved without them.
         
-        return words
+        Args:
+            vacancy: Parsed vacancy
+            
+        Returns:
+            Iterator over words
+        """
+        tokens = vacancy.get('tokens')
+        if tokens is not None:
+            return iter(tokens.split())
+        return self._tokenize_vacancy(vacancy)
     
     def extract_keywords(self, vacancies: List[Dict]) -> Counter:
         """
@@ -64,13 +135,18 @@ class VacancyAnalyzer:
         Returns:
             Counter with keyword frequencies
         """
-        word_counter = Counter()
+        # Feed token streams straight into the counter; no per-vacancy
+        # word list is materialized
+        word_counter = Counter(chain.from_iterable(
+            self._vacancy_words(vacancy) for vacancy in vacancies
+        ))
         
-        for vacancy in vacancies:
-            # Analyze full text
-            full_text = vacancy.get('full_text', '')
-            words = self._tokenize(full_text)
-            word_counter.update(words)
+        # Drop stop words and (stored) words that are too short once per
+        # distinct word rather than testing every token on the way in
+        for word in self.stop_words:
+            word_counter.pop(word, None)
+        for word in [w for w in word_counter if len(w) < self.min_word_length]:
+            del word_counter[word]
         
         return word_counter
     
@@ -84,13 +160,10 @@ class VacancyAnalyzer:
         Returns:
             Counter with skill frequencies
         """
-        skill_counter = Counter()
-        
-        for vacancy in vacancies:
-            skills = vacancy.get('key_skills', [])
-            skill_counter.update(skills)
-        
-        return skill_counter
+        # One flat iterator lets Counter count every skill in C
+        return Counter(chain.from_iterable(
+            vacancy.get('key_skills') or () for vacancy in vacancies
+        ))
     
     def analyze_salary_range(self, vacancies: List[Dict]) -> Dict:
         """
@@ -102,36 +175,37 @@ class VacancyAnalyzer:
         Returns:
             Dictionary with salary statistics
         """
-        salaries_from = []
-        salaries_to = []
-        vacancies_with_salary = 0
-        
-        for vacancy in vacancies:
-            has_salary = False
-            if vacancy.get('salary_from'):
-                salaries_from.append(vacancy['salary_from'])
-                has_salary = True
-            if vacancy.get('salary_to'):
-                salaries_to.append(vacancy['salary_to'])
-                has_salary = True
-            
-            if has_salary:
-                vacancies_with_salary += 1
+        count = len(vacancies)
+        
+        # One array per bound, with missing salaries stored as 0 so the
+        # reductions below run in NumPy instead of the interpreter
+        salaries_from = np.fromiter(
+            (vacancy.get('salary_from') or 0 for vacancy in vacancies),
+            dtype=np.int64, count=count
+        )
+        salaries_to = np.fromiter(
+            (vacancy.get('salary_to') or 0 for vacancy in vacancies),
+            dtype=np.int64, count=count
+        )
+        has_from = salaries_from != 0
+        has_to = salaries_to != 0
         
         stats = {
-            'count_with_salary': vacancies_with_salary,  # Fixed: count unique vacancies
-            'count_total': len(vacancies),
+            'count_with_salary': int(np.count_nonzero(has_from | has_to)),  # Fixed: count unique vacancies
+            'count_total': count,
         }
         
-        if salaries_from:
-            stats['min_from'] = min(salaries_from)
-            stats['max_from'] = max(salaries_from)
-            stats['avg_from'] = sum(salaries_from) / len(salaries_from)
+        if has_from.any():
+            salaries_from = salaries_from[has_from]
+            stats['min_from'] = salaries_from.min().item()
+            stats['max_from'] = salaries_from.max().item()
+            stats['avg_from'] = salaries_from.mean().item()
         
-        if salaries_to:
-            stats['min_to'] = min(salaries_to)
-            stats['max_to'] = max(salaries_to)
-            stats['avg_to'] = sum(salaries_to) / len(salaries_to)
+        if has_to.any():
+            salaries_to = salaries_to[has_to]
+            stats['min_to'] = salaries_to.min().item()
+            stats['max_to'] = salaries_to.max().item()
+            stats['avg_to'] = salaries_to.mean().item()
         
         return stats
     
@@ -145,14 +219,12 @@ class VacancyAnalyzer:
         Returns:
             Counter with experience level frequencies
         """
-        experience_counter = Counter()
-        
-        for vacancy in vacancies:
-            exp = vacancy.get('experience', '')
-            if exp:
-                experience_counter[exp] += 1
-        
-        return experience_counter
+        # Counter's C counting loop is much cheaper than a per-item
+        # get-and-increment in Python
+        return Counter(
+            exp for exp in (vacancy.get('experience') for vacancy in vacancies)
+            if exp
+        )
     
     def get_top_keywords(self, word_counter: Counter, limit: Optional[int] = None) -> List[tuple]:
         """
@@ -168,14 +240,15 @@ class VacancyAnalyzer:
         if limit is None:
             limit = self.top_keywords
         
-        # Filter by minimum frequency
-        filtered = {
-            word: count 
-            for word, count in word_counter.items() 
-            if count >= self.min_frequency
-        }
+        # Filter by minimum frequency and keep the top entries in a bounded
+        # heap instead of copying the survivors into a new Counter
+        min_frequency = self.min_frequency
+        filtered = (
+            item for item in word_counter.items()
+            if item[1] >= min_frequency
+        )
         
-        return Counter(filtered).most_common(limit)
+        return heapq.nlargest(limit, filtered, key=itemgetter(1))
     
     def generate_resume_tips(self, word_counter: Counter, skill_counter: Counter) -> List[str]:
         """
@@ -230,6 +303,3 @@ class VacancyAnalyzer:
         }
         
         return report
-
-
-from typing import Optional
@@ -1,7 +1,13 @@
 """HH.ru API Client for fetching job vacancies."""
 
+import orjson
 import requests
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -22,26 +28,51 @@ class HHAPIClient:
         }
         self.timeout = config['api']['timeout']
         self.requests_per_second = config['api']['requests_per_second']
-        self.last_request_time = 0
+        self.max_workers = config['api'].get('max_workers', 4)
+        self._min_interval = 1.0 / self.requests_per_second
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        
+        # One session for all requests: connections (and TLS) are kept alive
+        # and reused; failed requests are retried with exponential backoff
+        retry = Retry(
+            total=config['api'].get('retries', 3),
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(self.max_workers, 1),
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def _rate_limit(self):
-        """Ensure we don't exceed rate limits."""
-        elapsed = time.time() - self.last_request_time
-        min_interval = 1.0 / self.requests_per_second
+        """Ensure we don't exceed rate limits (shared by all worker threads)."""
+        # Reserve the next send slot under the lock, then sleep outside it.
+        # The monotonic clock never jumps on NTP adjustments, and a slot that
+        # is already in the past (the previous round-trip took longer than
+        # the interval) means no sleep at all.
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_request_time)
+            self._next_request_time = send_at + self._min_interval
         
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-            
-        self.last_request_time = time.time()
+        delay = send_at - now
+        if delay > 0:
+            time.sleep(delay)
     
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None, retries: int = 3) -> Dict:
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
-        Make HTTP request to API with retry logic.
+        Make HTTP request to API (retries are handled by the session adapter).
         
         Args:
             endpoint: API endpoint
             params: Query parameters
-            retries: Number of retry attempts
             
         Returns:
             JSON response as dictionary
@@ -52,24 +83,10 @@ class HHAPIClient:
         self._rate_limit()
         url = f"{self.base_url}/{endpoint}"
         
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == retries - 1:
-                    raise
-                print(f"Request failed (attempt {attempt + 1}/{retries}): {e}")
-                time.sleep(2 ** attempt)  # Exponential backoff
-                
-        return {}
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        # orjson decodes the raw bytes considerably faster than response.json()
+        return orjson.loads(response.content)
     
     def search_vacancies(
         self,
@@ -125,6 +142,23 @@ class HHAPIClient:
         """
         return self._make_request(f'vacancies/{vacancy_id}')
     
+    def _get_details_or_summary(self, vacancy: Dict) -> Dict:
+        """
+        Get full vacancy details, falling back to the search summary on error.
+        
+        Args:
+            vacancy: Vacancy summary from search results
+            
+        Returns:
+            Detailed vacancy dictionary, or the summary if the fetch failed
+        """
+        try:
+            return self.get_vacancy_details(vacancy['id'])
+        except Exception as e:
+            print(f"Failed to fetch details for vacancy {vacancy['id']}: {e}")
+            # Use basic info if details fetch fails
+            return vacancy
+    
     def collect_all_vacancies(
         self,
         text: str,
@@ -153,44 +187,62 @@ class HHAPIClient:
             List of vacancy dictionaries
         """
         all_vacancies = []
+        search_params = {
+            'text': text,
+            'area': area,
+            'period': period,
+            'per_page': per_page,
+            'experience': experience,
+            'employment': employment,
+        }
         
-        for page in range(max_pages):
-            print(f"Fetching page {page + 1}/{max_pages}...")
-            
-            result = self.search_vacancies(
-                text=text,
-                area=area,
-                period=period,
-                per_page=per_page,
-                page=page,
-                experience=experience,
-                employment=employment
-            )
-            
-            vacancies = result.get('items', [])
+        # First page tells how many pages there are
+        print(f"Fetching page 1/{max_pages}...")
+        first_page = self.search_vacancies(page=0, **search_params)
+        total_pages = min(max_pages, first_page.get('pages', 1))
+        
+        # Requests are spaced by _rate_limit, but network round-trips of
+        # pages and vacancy details overlap on the worker threads
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if total_pages > 1:
+                print(f"Fetching pages 2-{total_pages}/{max_pages}...")
+            page_futures = [
+                executor.submit(self.search_vacancies, page=page, **search_params)
+                for page in range(1, total_pages)
+            ]
+            results = chain([first_page], (future.result() for future in page_futures))
             
-            if not vacancies:
-                print(f"No more vacancies found (stopped at page {page + 1})")
-                break
-                
-            if with_details:
-                # Fetch detailed info for each vacancy
-                for vacancy in vacancies:
-                    try:
-                        detailed = self.get_vacancy_details(vacancy['id'])
-                        all_vacancies.append(detailed)
-                    except Exception as e:
-                        print(f"Failed to fetch details for vacancy {vacancy['id']}: {e}")
-                        # Use basic info if details fetch fails
-                        all_vacancies.append(vacancy)
-            else:
-                all_vacancies.extend(vacancies)
+            # Detail requests for a page are queued as soon as that page
+            # arrives, without waiting for the details of earlier pages
+            detail_futures = []
+            try:
+                for page, result in enumerate(results):
+                    vacancies = result.get('items', [])
+                    
+                    if not vacancies:
+                        print(f"No more vacancies found (stopped at page {page + 1})")
+                        for future in page_futures:
+                            future.cancel()
+                        break
+                        
+                    if with_details:
+                        detail_futures.extend(
+                            executor.submit(self._get_details_or_summary, vacancy)
+                            for vacancy in vacancies
+                        )
+                    else:
+                        all_vacancies.extend(vacancies)
+                else:
+                    # Only when no empty page stopped the loop early
+                    if total_pages < max_pages:
+                        print(f"Reached last page ({total_pages})")
                 
-            # Check if this is the last page
-            total_pages = result.get('pages', 1)
-            if page + 1 >= total_pages:
-                print(f"Reached last page ({total_pages})")
-                break
+                all_vacancies.extend(future.result() for future in detail_futures)
+            except BaseException:
+                # A failed page search ends the collection: cancel the queued
+                # requests instead of waiting for them when the pool shuts down
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
                 
         print(f"Collected {len(all_vacancies)} vacancies")
         return all_vacancies
@@ -1,7 +1,146 @@
 """Parser for extracting structured data from HH.ru vacancy responses."""
 
 from typing import Dict, Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import html
+import multiprocessing
+import os
+import pickle
 import re
+import sqlite3
+import sys
+
+from analyzer import join_tokens
+
+
+# Precompiled patterns for clean_html
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Bump whenever parse_vacancy output changes so cached results are reparsed
+# (3: drop entries parsed from search summaries)
+PARSER_VERSION = 3
+
+# Below this many vacancies, starting worker processes costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 200
+
+# Fields with only a handful of distinct values across all vacancies
+_CATEGORY_FIELDS = ('area', 'experience', 'employment', 'schedule', 'salary_currency')
+
+
+def process_context():
+    """
+    Multiprocessing context for parser worker processes.
+    
+    Forking a process that runs threads (the web server, the API client's
+    pool) can copy their locks in a held state and deadlock the child, so
+    workers are started by forkserver where available and spawn elsewhere.
+    
+    Returns:
+        Multiprocessing context to pass to ProcessPoolExecutor
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _intern_categories(parsed: Dict) -> Dict:
+    """
+    Intern low-cardinality string fields of a parsed vacancy in place.
+    
+    Vacancies then share one string object per distinct value, which saves
+    memory and lets Counter match equal values by identity. Strings that
+    come back from worker processes or the parse cache are fresh copies,
+    so those results have to be interned again in this process.
+    
+    Args:
+        parsed: Parsed vacancy
+        
+    Returns:
+        The same vacancy
+    """
+    for field in _CATEGORY_FIELDS:
+        value = parsed.get(field)
+        if value:
+            parsed[field] = sys.intern(value)
+    return parsed
+
+
+class ParseCache:
+    """On-disk cache of parsed vacancies keyed by (id, published_at)."""
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path: Path to SQLite cache file
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS parsed_vacancies (
+                id TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (id, published_at)
+            )
+        ''')
+    
+    @staticmethod
+    def key(vacancy_data: Dict) -> tuple:
+        """Cache key for a raw vacancy; a republished vacancy gets a new key."""
+        return (str(vacancy_data.get('id')), vacancy_data.get('published_at') or '')
+    
+    def get_many(self, keys: List[tuple]) -> Dict[tuple, Dict]:
+        """
+        Look up parsed vacancies for the given keys.
+        
+        Args:
+            keys: (id, published_at) pairs
+            
+        Returns:
+            Mapping of key to parsed vacancy for every cache hit
+        """
+        wanted = set(keys)
+        ids = list({vacancy_id for vacancy_id, _ in wanted})
+        found = {}
+        # Stay under SQLite's default limit of 999 bound parameters
+        for i in range(0, len(ids), 998):
+            batch = ids[i:i + 998]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f'SELECT id, published_at, data FROM parsed_vacancies '
+                f'WHERE version = ? AND id IN ({placeholders})',
+                [PARSER_VERSION] + batch
+            )
+            for vacancy_id, published_at, data in rows:
+                key = (vacancy_id, published_at)
+                if key in wanted:
+                    found[key] = _intern_categories(pickle.loads(data))
+        return found
+    
+    def put_many(self, items: Dict[tuple, Dict]):
+        """
+        Store parsed vacancies.
+        
+        Args:
+            items: Mapping of (id, published_at) key to parsed vacancy
+        """
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO parsed_vacancies VALUES (?, ?, ?, ?)',
+                [
+                    (vacancy_id, published_at, PARSER_VERSION,
+                     pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+                    for (vacancy_id, published_at), parsed in items.items()
+                ]
+            )
+    
+    def close(self):
+        """Close the cache database."""
+        self.conn.close()
 
 
 class VacancyParser:
@@ -22,15 +161,11 @@ class VacancyParser:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        # Decode common HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
+        text = _HTML_TAG_RE.sub('', text)
+        # Decode HTML entities in one pass (&nbsp; becomes a whitespace char)
+        text = html.unescape(text)
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
     
     @staticmethod
@@ -107,17 +242,81 @@ class VacancyParser:
         ]
         parsed['full_text'] = ' '.join(filter(None, text_parts))
         
-        return parsed
+        # Lowercased copies for keyword search and the tokenized full text
+        # for keyword counts, computed once at ingest
+        parsed['description_lc'] = parsed['description'].lower()
+        parsed['full_text_lc'] = parsed['full_text'].lower()
+        parsed['tokens'] = join_tokens(parsed['full_text_lc'])
+        
+        return _intern_categories(parsed)
     
     @staticmethod
-    def parse_multiple(vacancies: List[Dict]) -> List[Dict]:
+    def parse_multiple(vacancies: List[Dict], cache_path: Optional[str] = None) -> List[Dict]:
         """
         Parse multiple vacancies.
         
         Args:
             vacancies: List of raw vacancy data
+            cache_path: Optional path to a ParseCache database; vacancies
+                already parsed with the same (id, published_at) are reused
             
         Returns:
             List of parsed vacancies
         """
-        return [VacancyParser.parse_vacancy(v) for v in vacancies]
+        if not cache_path:
+            return VacancyParser._parse_all(vacancies)
+        
+        cache = ParseCache(cache_path)
+        try:
+            keys = [ParseCache.key(v) for v in vacancies]
+            cached = cache.get_many(keys)
+            
+            # Parse only the cache misses, as one batch
+            missing = [i for i, key in enumerate(keys) if key not in cached]
+            fresh = VacancyParser._parse_all([vacancies[i] for i in missing])
+            
+            # Search summaries (a failed detail fetch falls back to one) have
+            # no description or key skills; caching them would hide the full
+            # vacancy from later collections under the same key
+            misses = {
+                keys[i]: result
+                for i, result in zip(missing, fresh)
+                if 'description' in vacancies[i]
+            }
+            
+            if misses:
+                cache.put_many(misses)
+            print(f"Parse cache: {len(vacancies) - len(missing)} hits, {len(missing)} misses")
+            
+            fresh = iter(fresh)
+            return [
+                cached[key] if key in cached else next(fresh)
+                for key in keys
+            ]
+        finally:
+            cache.close()
+    
+    @staticmethod
+    def _parse_all(vacancies: List[Dict]) -> List[Dict]:
+        """
+        Parse vacancies, spreading large batches over worker processes.
+        
+        HTML cleanup is CPU-bound and each vacancy is independent, so big
+        batches are parsed in a process pool to get past the GIL.
+        
+        Args:
+            vacancies: List of raw vacancy data
+            
+        Returns:
+            List of parsed vacancies, in input order
+        """
+        if len(vacancies) < PARALLEL_PARSE_THRESHOLD:
+            return [VacancyParser.parse_vacancy(v) for v in vacancies]
+        
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(vacancies) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as executor:
+            return [
+                _intern_categories(parsed)
+                for parsed in executor.map(VacancyParser.parse_vacancy, vacancies, chunksize=chunksize)
+            ]
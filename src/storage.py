@@ -1,12 +1,103 @@
 """Storage module for saving and loading vacancy data."""
 
 import sqlite3
-import json
+import threading
 import csv
-from typing import List, Dict
+import io
+import orjson
+from operator import itemgetter
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
+from analyzer import join_tokens
+
+
+# Columns included in CSV exports
+CSV_COLUMNS = [
+    'id', 'name', 'company_name', 'area', 'experience',
+    'salary_from', 'salary_to', 'salary_currency',
+    'url', 'published_at'
+]
+
+# Columns written by save_vacancies, in row tuple order
+VACANCY_COLUMNS = (
+    'id', 'project_id', 'name', 'url', 'published_at', 'created_at',
+    'company_name', 'company_url', 'area', 'experience', 'employment', 'schedule',
+    'salary_from', 'salary_to', 'salary_currency', 'salary_gross',
+    'description', 'full_text', 'fetched_at',
+    'description_lc', 'full_text_lc', 'tokens'
+)
+
+# Stored in PRAGMA user_version once _init_db has brought a database up to
+# the current schema; bump it whenever _init_db gains a migration
+SCHEMA_VERSION = 1
+
+# Picks a vacancy row tuple out of a dict holding every VACANCY_COLUMNS key
+_vacancy_row = itemgetter(*VACANCY_COLUMNS)
+
+# Updates an existing vacancy in place (same rowid) instead of the delete and
+# re-insert done by INSERT OR REPLACE
+_UPSERT_VACANCY_SQL = (
+    f"INSERT INTO vacancies ({', '.join(VACANCY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(VACANCY_COLUMNS))}) "
+    f"ON CONFLICT(id, project_id) DO UPDATE SET "
+    + ', '.join(f'{column} = excluded.{column}' for column in VACANCY_COLUMNS[2:])
+)
+
+
+# Streamed CSV output is handed out in chunks of about this many characters
+CSV_CHUNK_SIZE = 1 << 16
+
+
+def iter_json_chunks(vacancies: Iterable[Dict]) -> Iterator[bytes]:
+    """
+    Serialize vacancies as an indented JSON array, one chunk per record.
+    
+    Each record is encoded on its own, so vacancies can be a generator
+    (e.g. VacancyStorage.iter_vacancies) and memory use stays flat. The
+    array bracket travels with the first record, so there is one chunk per
+    vacancy plus the closing one.
+    
+    Args:
+        vacancies: Vacancy dictionaries
+        
+    Yields:
+        UTF-8 encoded pieces of the JSON document
+    """
+    separator = b'[\n  '
+    for vacancy in vacancies:
+        # orjson writes UTF-8 directly, like ensure_ascii=False; records are
+        # indented one level so the output matches a whole-array indent=2 dump
+        record = orjson.dumps(vacancy, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        yield separator + record.replace(b'\n', b'\n  ')
+        separator = b',\n  '
+    yield b'[]' if separator == b'[\n  ' else b'\n]'
+
+
+def iter_csv_chunks(vacancies: Iterable[Dict]) -> Iterator[str]:
+    """
+    Serialize vacancies as CSV (CSV_COLUMNS only), a header row first.
+    
+    Args:
+        vacancies: Vacancy dictionaries
+        
+    Yields:
+        Pieces of the CSV text of roughly CSV_CHUNK_SIZE characters
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    
+    for vacancy in vacancies:
+        writer.writerow([vacancy.get(column) for column in CSV_COLUMNS])
+        if buffer.tell() >= CSV_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
+
 
 class VacancyStorage:
     """Storage handler for vacancy data."""
@@ -20,13 +111,83 @@ class VacancyStorage:
         """
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        # One long-lived connection shared by all threads, so prepared
+        # statements and the page cache survive between calls; the lock keeps
+        # statements and transactions from different threads from interleaving
+        self._lock = threading.RLock()
+        self.conn = self._connect()
         self._init_db()
     
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            self.conn.close()
+    
+    def __del__(self):
+        conn = getattr(self, 'conn', None)
+        if conn is not None:
+            conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a database connection with the per-connection settings applied.
+        
+        Returns:
+            SQLite connection
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # In WAL mode NORMAL only syncs at checkpoints and stays crash-safe
+        conn.execute('PRAGMA synchronous=NORMAL')
+        # 64 MB page cache, temporary b-trees in memory, and reads served
+        # from a memory map of up to 256 MB instead of read() calls
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        # Foreign key enforcement (and ON DELETE CASCADE) is off by default
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+    
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
+        # Runs from __init__, before the connection is shared with other threads
+        conn = self.conn
         cursor = conn.cursor()
         
+        # Up-to-date databases skip the schema checks below
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
+        # Tables are renamed and copied below; keys are checked again once
+        # the schema is in place
+        cursor.execute('PRAGMA foreign_keys=OFF')
+        
+        # WAL lets readers run while a collection is writing; the mode is
+        # stored in the database file, so setting it once is enough
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
+        # Migrate in a single transaction: a failure part way leaves the
+        # database as it was instead of half migrated. Both pragmas above are
+        # ignored inside a transaction, so they come first
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            self._migrate_schema(cursor)
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            cursor.execute('PRAGMA foreign_keys=ON')
+    
+    def _migrate_schema(self, cursor: sqlite3.Cursor):
+        """
+        Create missing tables and bring older schemas up to date.
+        
+        Args:
+            cursor: Cursor inside the transaction opened by _init_db
+        """
         # Check if we need migration (old schema without projects)
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='projects'")
         needs_migration = cursor.fetchone() is None
@@ -40,6 +201,23 @@ class VacancyStorage:
                 cursor.execute("ALTER TABLE vacancies RENAME TO vacancies_old")
                 cursor.execute("ALTER TABLE skills RENAME TO skills_old")
         
+        # Foreign keys gained ON DELETE CASCADE later. SQLite cannot change a
+        # constraint in place, so older tables are set aside here, recreated
+        # below and copied back
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='skills'")
+        row = cursor.fetchone()
+        needs_rebuild = row is not None and 'ON DELETE CASCADE' not in row[0]
+        
+        if needs_rebuild:
+            print("Rebuilding tables with cascading foreign keys...")
+            
+            # Indexes move with a renamed table; drop them so they are
+            # created on the new tables
+            cursor.execute('DROP INDEX IF EXISTS idx_vacancies_project_salary')
+            cursor.execute('DROP INDEX IF EXISTS idx_skills_project_vacancy')
+            cursor.execute('ALTER TABLE vacancies RENAME TO vacancies_nocascade')
+            cursor.execute('ALTER TABLE skills RENAME TO skills_nocascade')
+        
         # Projects table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS projects (
@@ -81,8 +259,11 @@ class VacancyStorage:
                 description TEXT,
                 full_text TEXT,
                 fetched_at TEXT,
+                description_lc TEXT,
+                full_text_lc TEXT,
+                tokens TEXT,
                 PRIMARY KEY (id, project_id),
-                FOREIGN KEY (project_id) REFERENCES projects(id)
+                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
             )
         ''')
         
@@ -92,9 +273,25 @@ class VacancyStorage:
                 project_id INTEGER,
                 skill TEXT,
                 FOREIGN KEY (vacancy_id, project_id) REFERENCES vacancies(id, project_id)
+                    ON DELETE CASCADE
             )
         ''')
         
+        # Salary filters and counts for a project are answered from this index
+        # without reading the (wide) vacancy rows
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_vacancies_project_salary
+            ON vacancies(project_id, salary_from, salary_to)
+        ''')
+        
+        # Skills are always looked up by project (and vacancy). The skill is
+        # deliberately not part of the key: entries for one vacancy then stay
+        # in rowid order, which keeps skills in the order they were saved
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_skills_project_vacancy
+            ON skills(project_id, vacancy_id)
+        ''')
+        
         # Migrate old data if needed
         if needs_migration:
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='vacancies_old'")
@@ -103,7 +300,12 @@ class VacancyStorage:
                 
                 # Copy vacancies
                 cursor.execute('''
-                    INSERT INTO vacancies 
+                    INSERT INTO vacancies (
+                        id, project_id, name, url, published_at, created_at,
+                        company_name, company_url, area, experience, employment, schedule,
+                        salary_from, salary_to, salary_currency, salary_gross,
+                        description, full_text, fetched_at
+                    )
                     SELECT id, 1 as project_id, name, url, published_at, created_at,
                            company_name, company_url, area, experience, employment, schedule,
                            salary_from, salary_to, salary_currency, salary_gross,
@@ -124,8 +326,39 @@ class VacancyStorage:
                 
                 print("Migration completed!")
         
-        conn.commit()
-        conn.close()
+        if needs_rebuild:
+            cursor.execute('PRAGMA table_info(vacancies_nocascade)')
+            copied = ', '.join(row[1] for row in cursor.fetchall())
+            cursor.execute(f'INSERT INTO vacancies ({copied}) SELECT {copied} FROM vacancies_nocascade')
+            cursor.execute('''
+                INSERT INTO skills (vacancy_id, project_id, skill)
+                SELECT vacancy_id, project_id, skill FROM skills_nocascade
+            ''')
+            cursor.execute("DROP TABLE skills_nocascade")
+            cursor.execute("DROP TABLE vacancies_nocascade")
+        
+        # Lowercased search text and token columns were added later: add
+        # them to existing databases and fill them in for rows saved before
+        cursor.execute('PRAGMA table_info(vacancies)')
+        columns = {row[1] for row in cursor.fetchall()}
+        missing = [c for c in ('description_lc', 'full_text_lc', 'tokens') if c not in columns]
+        for column in missing:
+            cursor.execute(f'ALTER TABLE vacancies ADD COLUMN {column} TEXT')
+        if missing or needs_migration or needs_rebuild:
+            # SQLite's lower() only handles ASCII, so lowercase in Python
+            self.conn.create_function('py_lower', 1, lambda t: t.lower() if t else t)
+            self.conn.create_function('py_tokens', 1, join_tokens)
+            cursor.execute('''
+                UPDATE vacancies
+                SET description_lc = py_lower(description),
+                    full_text_lc = py_lower(full_text)
+                WHERE full_text_lc IS NULL
+            ''')
+            cursor.execute('''
+                UPDATE vacancies
+                SET tokens = py_tokens(full_text_lc)
+                WHERE tokens IS NULL
+            ''')
     
     def save_vacancies(self, vacancies: List[Dict], project_id: int = 1):
         """
@@ -135,54 +368,49 @@ class VacancyStorage:
             vacancies: List of parsed vacancy dictionaries
             project_id: ID of the project to save vacancies to
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         fetched_at = datetime.now().isoformat()
         
-        for vacancy in vacancies:
-            # Insert vacancy
-            cursor.execute('''
-                INSERT OR REPLACE INTO vacancies VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            ''', (
-                vacancy.get('id'),
-                project_id,
-                vacancy.get('name'),
-                vacancy.get('url'),
-                vacancy.get('published_at'),
-                vacancy.get('created_at'),
-                vacancy.get('company_name'),
-                vacancy.get('company_url'),
-                vacancy.get('area'),
-                vacancy.get('experience'),
-                vacancy.get('employment'),
-                vacancy.get('schedule'),
-                vacancy.get('salary_from'),
-                vacancy.get('salary_to'),
-                vacancy.get('salary_currency'),
-                vacancy.get('salary_gross'),
-                vacancy.get('description'),
-                vacancy.get('full_text'),
-                fetched_at
-            ))
-            
-            # Delete existing skills for this vacancy and project
-            cursor.execute(
-                'DELETE FROM skills WHERE vacancy_id = ? AND project_id = ?',
-                (vacancy.get('id'), project_id)
-            )
+        # Later duplicates of the same vacancy win, as with row-by-row inserts
+        unique_vacancies = {vacancy.get('id'): vacancy for vacancy in vacancies}
+        
+        # Missing keys fall back to None, like .get() did
+        defaults = dict.fromkeys(VACANCY_COLUMNS)
+        
+        # Rows are generated as executemany binds them rather than collected
+        # in lists first
+        vacancy_rows = (
+            _vacancy_row({
+                **defaults,
+                **vacancy,
+                'project_id': project_id,
+                'fetched_at': fetched_at
+            })
+            for vacancy in unique_vacancies.values()
+        )
+        skill_rows = (
+            (vacancy_id, project_id, skill)
+            for vacancy_id, vacancy in unique_vacancies.items()
+            for skill in vacancy.get('key_skills', [])
+        )
+        
+        with self._lock:
+            # Write the whole batch in a single transaction, taking the write
+            # lock up front so a concurrent writer cannot make it fail midway
+            with self.conn:
+                self.conn.execute('BEGIN IMMEDIATE')
+                self.conn.executemany(_UPSERT_VACANCY_SQL, vacancy_rows)
             
-            # Insert skills
-            for skill in vacancy.get('key_skills', []):
-                cursor.execute(
-                    'INSERT INTO skills VALUES (?, ?, ?)',
-                    (vacancy.get('id'), project_id, skill)
-                )
-        
-        conn.commit()
-        conn.close()
+                # Replace existing skills for these vacancies, with one DELETE
+                # per chunk of ids (SQLite allows 999 bound parameters)
+                vacancy_ids = list(unique_vacancies)
+                for i in range(0, len(vacancy_ids), 998):
+                    batch = vacancy_ids[i:i + 998]
+                    placeholders = ', '.join('?' * len(batch))
+                    self.conn.execute(
+                        f'DELETE FROM skills WHERE project_id = ? AND vacancy_id IN ({placeholders})',
+                        [project_id, *batch]
+                    )
+                self.conn.executemany('INSERT INTO skills VALUES (?, ?, ?)', skill_rows)
         print(f"Saved {len(vacancies)} vacancies to project {project_id}")
     
     def load_vacancies(self, project_id: int = 1) -> List[Dict]:
@@ -195,75 +423,210 @@ class VacancyStorage:
         Returns:
             List of vacancy dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self.conn.cursor()
+            
+            # Skills come back already aggregated per vacancy as a JSON array,
+            # so vacancies and skills are read in a single query
+            cursor.execute('''
+                SELECT v.*, (
+                    SELECT json_group_array(s.skill) FROM skills s
+                    WHERE s.project_id = v.project_id AND s.vacancy_id = v.id
+                ) AS skills_json
+                FROM vacancies v
+                WHERE v.project_id = ?
+                ORDER BY v.rowid
+            ''', (project_id,))
+            rows = cursor.fetchall()
+            
+            # Plain tuples zipped with the column names once are about twice
+            # as fast to turn into dicts as sqlite3.Row objects
+            names = [d[0] for d in cursor.description]
+            vacancies = []
+            for row in rows:
+                vacancy = dict(zip(names, row))
+                vacancy['key_skills'] = orjson.loads(vacancy.pop('skills_json'))
+                vacancies.append(vacancy)
+        
+        return vacancies
+    
+    def iter_vacancies(self, project_id: int = 1) -> Iterator[Dict]:
+        """
+        Iterate over vacancies of a project without loading them all at once.
         
-        cursor.execute('SELECT * FROM vacancies WHERE project_id = ?', (project_id,))
-        rows = cursor.fetchall()
+        Rows are read from the cursor one at a time, so memory use does not
+        grow with the project size (skills are small and loaded up front).
         
-        vacancies = []
-        for row in rows:
-            vacancy = dict(row)
+        Args:
+            project_id: ID of the project to load vacancies from
             
-            # Load skills for this vacancy and project
-            cursor.execute(
-                'SELECT skill FROM skills WHERE vacancy_id = ? AND project_id = ?',
-                (vacancy['id'], project_id)
+        Yields:
+            Vacancy dictionaries
+        """
+        # Streaming can take a while (exports), so it reads through its own
+        # connection instead of holding the shared one
+        conn = self._connect()
+        
+        try:
+            skills_by_id = {}
+            for vacancy_id, skill in conn.execute(
+                'SELECT vacancy_id, skill FROM skills WHERE project_id = ?',
+                (project_id,)
+            ):
+                skills_by_id.setdefault(vacancy_id, []).append(skill)
+            
+            rows = conn.execute(
+                'SELECT * FROM vacancies WHERE project_id = ? ORDER BY rowid', (project_id,)
             )
-            skills = [skill[0] for skill in cursor.fetchall()]
-            vacancy['key_skills'] = skills
+            names = [d[0] for d in rows.description]
+            for row in rows:
+                vacancy = dict(zip(names, row))
+                vacancy['key_skills'] = skills_by_id.get(vacancy['id'], [])
+                yield vacancy
+        finally:
+            conn.close()
+    
+    def count_vacancies(self, project_id: int = 1) -> int:
+        """Count vacancies stored for a specific project."""
+        with self._lock:
+            cursor = self.conn.cursor()
             
-            vacancies.append(vacancy)
+            cursor.execute('SELECT COUNT(*) FROM vacancies WHERE project_id = ?', (project_id,))
+            count = cursor.fetchone()[0]
         
-        conn.close()
-        return vacancies
+        return count
+    
+    def query_vacancies(
+        self,
+        project_id: int = 1,
+        min_salary: Optional[int] = None,
+        max_salary: Optional[int] = None,
+        hide_empty: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        Load vacancies for a project with salary filters and pagination done in SQL.
+        
+        Args:
+            project_id: ID of the project to load vacancies from
+            min_salary: Minimum salary filter
+            max_salary: Maximum salary filter
+            hide_empty: Hide vacancies without salary
+            limit: Maximum number of vacancies to return (None - all)
+            offset: Number of matching vacancies to skip
+            columns: Vacancy columns to load (None - all); 'id' and
+                'key_skills' are always included
+            
+        Returns:
+            Tuple of (vacancies, total number of matching vacancies)
+        """
+        # Same semantics as app.apply_filters: zero salaries count as missing
+        conditions = ['project_id = ?']
+        params = [project_id]
+        
+        if hide_empty:
+            conditions.append('(salary_from IS NOT NULL OR salary_to IS NOT NULL)')
+        if min_salary is not None:
+            conditions.append(
+                '((salary_from AND salary_from >= ?) OR (salary_to AND salary_to >= ?))'
+            )
+            params.extend([min_salary, min_salary])
+        if max_salary is not None:
+            conditions.append(
+                '((salary_from AND salary_from <= ?) OR (salary_to AND salary_to <= ?)'
+                ' OR (salary_from IS NULL AND salary_to IS NULL))'
+            )
+            params.extend([max_salary, max_salary])
+        
+        where = ' AND '.join(conditions)
+        select = '*' if columns is None else ', '.join(['id', *columns])
+        sql = f'SELECT {select} FROM vacancies WHERE {where} ORDER BY rowid'
+        
+        with self._lock:
+            cursor = self.conn.cursor()
+            
+            if limit is not None:
+                # Count from the salary index, then read full rows for one page only
+                cursor.execute(f'SELECT COUNT(*) FROM vacancies WHERE {where}', params)
+                total = cursor.fetchone()[0]
+                cursor.execute(sql + ' LIMIT ? OFFSET ?', [*params, limit, offset])
+            else:
+                cursor.execute(sql, params)
+            
+            names = [d[0] for d in cursor.description]
+            vacancies = []
+            for row in cursor.fetchall():
+                vacancy = dict(zip(names, row))
+                vacancy['key_skills'] = []
+                vacancies.append(vacancy)
+            
+            if limit is None:
+                total = len(vacancies)
+            
+            # Load skills only for the returned vacancies
+            if vacancies:
+                by_id = {v['id']: v for v in vacancies}
+                if limit is not None:
+                    placeholders = ', '.join('?' * len(by_id))
+                    cursor.execute(
+                        f'SELECT vacancy_id, skill FROM skills WHERE project_id = ? AND vacancy_id IN ({placeholders})',
+                        [project_id, *by_id]
+                    )
+                else:
+                    cursor.execute(
+                        'SELECT vacancy_id, skill FROM skills WHERE project_id = ?',
+                        (project_id,)
+                    )
+                for vacancy_id, skill in cursor.fetchall():
+                    if vacancy_id in by_id:
+                        by_id[vacancy_id]['key_skills'].append(skill)
+        
+        return vacancies, total
     
     # Project management methods
     def create_project(self, name: str, query: str = '') -> int:
         """Create a new project and return its ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        now = datetime.now().isoformat()
-        cursor.execute(
-            'INSERT INTO projects (name, query, created_at, updated_at) VALUES (?, ?, ?, ?)',
-            (name, query, now, now)
-        )
-        project_id = cursor.lastrowid
+        # Commits on success and rolls back on error, so a failed write never
+        # leaves the shared connection inside an open transaction
+        with self._lock, self.conn:
+            cursor = self.conn.cursor()
+            
+            now = datetime.now().isoformat()
+            cursor.execute(
+                'INSERT INTO projects (name, query, created_at, updated_at) VALUES (?, ?, ?, ?)',
+                (name, query, now, now)
+            )
+            project_id = cursor.lastrowid
         
-        conn.commit()
-        conn.close()
         return project_id
     
     def get_projects(self) -> List[Dict]:
         """Get all projects."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT p.*, COUNT(DISTINCT v.id) as vacancy_count
-            FROM projects p
-            LEFT JOIN vacancies v ON p.id = v.project_id
-            GROUP BY p.id
-            ORDER BY p.updated_at DESC
-        ''')
-        projects = [dict(row) for row in cursor.fetchall()]
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            
+            cursor.execute('''
+                SELECT p.*, COUNT(DISTINCT v.id) as vacancy_count
+                FROM projects p
+                LEFT JOIN vacancies v ON p.id = v.project_id
+                GROUP BY p.id
+                ORDER BY p.updated_at DESC
+            ''')
+            projects = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
         return projects
     
     def get_project(self, project_id: int) -> Dict:
         """Get a single project by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            
+            cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
+            row = cursor.fetchone()
         
         if row is None:
             return None
@@ -271,60 +634,47 @@ class VacancyStorage:
     
     def update_project(self, project_id: int, name: str = None, query: str = None):
         """Update project details."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        updates = []
-        params = []
-        
-        if name is not None:
-            updates.append('name = ?')
-            params.append(name)
-        if query is not None:
-            updates.append('query = ?')
-            params.append(query)
-        
-        updates.append('updated_at = ?')
-        params.append(datetime.now().isoformat())
-        params.append(project_id)
-        
-        cursor.execute(
-            f'UPDATE projects SET {', '.join(updates)} WHERE id = ?',
-            params
-        )
-        
-        conn.commit()
-        conn.close()
+        # One fixed statement (None keeps the current value), so it is
+        # prepared once and reused from the statement cache
+        with self._lock, self.conn:
+            self.conn.execute(
+                '''
+                UPDATE projects
+                SET name = COALESCE(?, name),
+                    query = COALESCE(?, query),
+                    updated_at = ?
+                WHERE id = ?
+                ''',
+                (name, query, datetime.now().isoformat(), project_id)
+            )
     
     def delete_project(self, project_id: int):
         """Delete a project and all its vacancies."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Delete skills
-        cursor.execute('DELETE FROM skills WHERE project_id = ?', (project_id,))
-        # Delete vacancies
-        cursor.execute('DELETE FROM vacancies WHERE project_id = ?', (project_id,))
-        # Delete project
-        cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self.conn:
+            # Vacancies and their skills go with it through ON DELETE CASCADE
+            self.conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
     
-    def export_to_json(self, vacancies: List[Dict], output_path: str):
+    def export_to_json(self, vacancies: Iterable[Dict], output_path: str):
         """
         Export vacancies to JSON file.
         
+        Records are written as iter_json_chunks produces them, so vacancies
+        can be a generator (e.g. iter_vacancies) and memory use stays flat.
+        
         Args:
-            vacancies: List of vacancy dictionaries
+            vacancies: Vacancy dictionaries
             output_path: Path to output JSON file
         """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(vacancies, f, ensure_ascii=False, indent=2)
+        chunks = 0
+        with open(output_path, 'wb') as f:
+            for chunk in iter_json_chunks(vacancies):
+                f.write(chunk)
+                chunks += 1
         
-        print(f"Exported {len(vacancies)} vacancies to {output_path}")
+        # One chunk per vacancy plus the closing one
+        print(f"Exported {chunks - 1} vacancies to {output_path}")
     
     def export_to_csv(self, vacancies: List[Dict], output_path: str):
         """
@@ -340,20 +690,34 @@ class VacancyStorage:
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # Define CSV columns
-        columns = [
-            'id', 'name', 'company_name', 'area', 'experience',
-            'salary_from', 'salary_to', 'salary_currency',
-            'url', 'published_at'
-        ]
-        
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(vacancies)
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            f.writelines(iter_csv_chunks(vacancies))
         
         print(f"Exported {len(vacancies)} vacancies to {output_path}")
     
+    def export_to_parquet(self, vacancies: Iterable[Dict], output: Union[str, BinaryIO]):
+        """
+        Export vacancies to a Parquet file.
+        
+        Parquet keeps column types (salaries stay numeric, skills stay
+        lists) and is compressed per column, so it is smaller and much
+        faster to load back (pandas.read_parquet) than CSV or JSON.
+        
+        Args:
+            vacancies: Vacancy dictionaries
+            output: Path to output Parquet file, or a binary file object
+        """
+        import pandas as pd  # Only needed for Parquet export
+        
+        frame = pd.DataFrame(list(vacancies))
+        
+        if isinstance(output, str):
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(output, compression='zstd', index=False)
+        
+        if isinstance(output, str):
+            print(f"Exported {len(frame)} vacancies to {output}")
+    
     def export_report(self, report: Dict, output_path: str):
         """
         Export analysis report to JSON file.
@@ -364,7 +728,7 @@ class VacancyStorage:
         """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"Exported report to {output_path}")
@@ -82,6 +82,7 @@ function setupEventListeners() {
     document.getElementById('refreshBtn').addEventListener('click', loadData);
     document.getElementById('exportJsonBtn').addEventListener('click', () => exportData('json'));
     document.getElementById('exportCsvBtn').addEventListener('click', () => exportData('csv'));
+    document.getElementById('exportParquetBtn').addEventListener('click', () => exportData('parquet'));
 
     // Modal controls
     document.getElementById('closeModal').addEventListener('click', closeModal);